@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["yara-x>=0.10.0"]
+# dependencies = ["yara-x>=0.10.0", "numpy>=1.26"]
 # ///
 """YARA-X string atom quality analyzer.
 
@@ -15,19 +15,30 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
+import functools
+import io
+import os
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import yara_x
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AtomIssue:
     """An issue with atom quality."""
 
@@ -37,7 +48,7 @@ class AtomIssue:
     suggestion: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StringAnalysis:
     """Analysis of a single string's atom quality."""
 
@@ -51,11 +62,11 @@ class StringAnalysis:
 
 # Repeated byte patterns that generate poor atoms
 REPEATED_PATTERNS = [
-    (rb"\x00\x00\x00\x00", "null bytes (0x00000000)"),
-    (rb"\x90\x90\x90\x90", "NOP sled (0x90909090)"),
-    (rb"\xCC\xCC\xCC\xCC", "INT3 padding (0xCCCCCCCC)"),
-    (rb"\xFF\xFF\xFF\xFF", "all 0xFF bytes"),
-    (rb"\x20\x20\x20\x20", "spaces (0x20202020)"),
+    (b"\x00\x00\x00\x00", "null bytes (0x00000000)"),
+    (b"\x90\x90\x90\x90", "NOP sled (0x90909090)"),
+    (b"\xCC\xCC\xCC\xCC", "INT3 padding (0xCCCCCCCC)"),
+    (b"\xFF\xFF\xFF\xFF", "all 0xFF bytes"),
+    (b"\x20\x20\x20\x20", "spaces (0x20202020)"),
 ]
 
 # Common 4-byte sequences that appear in many files
@@ -72,6 +83,97 @@ COMMON_SEQUENCES = [
     b"HTTP",
 ]
 
+# Patterns packed into little-endian uint32 for constant-time membership tests;
+# every pattern/sequence is exactly 4 bytes, so "pattern in atom" is equality
+_REPEATED_SET = frozenset(int.from_bytes(pattern, "little") for pattern, _ in REPEATED_PATTERNS)
+_COMMON_SET = frozenset(int.from_bytes(seq, "little") for seq in COMMON_SEQUENCES)
+_REPEATED_U32 = np.fromiter(_REPEATED_SET, dtype=np.uint32)
+_COMMON_U32 = np.fromiter(_COMMON_SET, dtype=np.uint32)
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _find_best_atom_nb(data: np.ndarray, wildcard_mask: np.ndarray) -> tuple[int, int]:
+        """Single-pass nopython kernel returning (best_offset, best_score).
+
+        Mirrors the NumPy scoring below; best_offset is -1 when no valid
+        window scores above zero.
+        """
+        n = data.shape[0]
+        best_index = -1
+        best_score = 0
+
+        for i in range(n - 3):
+            if (
+                wildcard_mask[i]
+                or wildcard_mask[i + 1]
+                or wildcard_mask[i + 2]
+                or wildcard_mask[i + 3]
+            ):
+                continue
+
+            b0 = data[i]
+            b1 = data[i + 1]
+            b2 = data[i + 2]
+            b3 = data[i + 3]
+
+            score = 100
+
+            duplicates = int(b1 == b0) + int(b2 in (b0, b1)) + int(b3 in (b0, b1, b2))
+            unique_count = 4 - duplicates
+            if unique_count == 1:
+                score -= 80
+            elif unique_count == 2:
+                score -= 40
+
+            score -= (int(b0 == 0) + int(b1 == 0) + int(b2 == 0) + int(b3 == 0)) * 15
+
+            packed = (
+                np.uint32(b0)
+                | (np.uint32(b1) << 8)
+                | (np.uint32(b2) << 16)
+                | (np.uint32(b3) << 24)
+            )
+            for j in range(_REPEATED_U32.shape[0]):
+                if packed == _REPEATED_U32[j]:
+                    score -= 60
+                    break
+            for j in range(_COMMON_U32.shape[0]):
+                if packed == _COMMON_U32[j]:
+                    score -= 30
+                    break
+
+            if (
+                0x20 <= b0 <= 0x7E
+                and 0x20 <= b1 <= 0x7E
+                and 0x20 <= b2 <= 0x7E
+                and 0x20 <= b3 <= 0x7E
+            ):
+                score -= 10
+
+            if score < 0:
+                score = 0
+            if score > best_score:
+                best_score = score
+                best_index = i
+                # No window can beat a perfect score; stop scanning
+                if best_score == 100:
+                    break
+
+        return best_index, best_score
+
+else:
+    _find_best_atom_nb = None
+
+
+# Hot-path regexes, compiled once at import
+_RULE_NAMES = re.compile(rb"(?:private\s+)?rule\s+(\w+)\s*[:{]")
+
+# Hex-token classification via set membership; cheaper than the regex engine
+# for the thousands of 2-char tokens in long hex strings
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_HEX_OR_WILD = _HEX_DIGITS | {"?"}
+
 
 def hex_string_to_bytes(hex_str: str) -> tuple[bytes, list[int]]:
     """Convert YARA hex string to bytes and wildcard positions.
@@ -90,182 +192,236 @@ def hex_string_to_bytes(hex_str: str) -> tuple[bytes, list[int]]:
     pos = 0
 
     for token in tokens:
+        if len(token) != 2:
+            # Skip jumps and alternatives for simplicity
+            continue
         if token == "??":
             result.append(0x00)
             wildcard_positions.append(pos)
             pos += 1
-        elif re.match(r"^[0-9A-Fa-f]{2}$", token):
+        elif token[0] in _HEX_DIGITS and token[1] in _HEX_DIGITS:
             result.append(int(token, 16))
             pos += 1
-        elif re.match(r"^[0-9A-Fa-f?]{2}$", token):
+        elif token[0] in _HEX_OR_WILD and token[1] in _HEX_OR_WILD:
             # Nibble wildcard like "5?" or "?A"
             result.append(0x00)
             wildcard_positions.append(pos)
             pos += 1
-        # Skip jumps and alternatives for simplicity
 
     return bytes(result), wildcard_positions
 
 
-def find_best_atom(data: bytes, wildcard_positions: list[int]) -> tuple[str | None, int]:
+@functools.lru_cache(maxsize=8192)
+def find_best_atom(data: bytes, wildcard_positions: tuple[int, ...]) -> tuple[str | None, int]:
     """Find the best 4-byte atom in a byte sequence.
 
+    Cached on the raw inputs so identical strings across rules and files
+    (common headers, URLs) skip the window scan entirely.
+
     Returns:
         Tuple of (atom as hex string, score 0-100)
     """
     if len(data) < 4:
         return None, 0
 
-    best_atom = None
-    best_score = 0
+    arr = np.frombuffer(data, dtype=np.uint8)
+    wildcard_mask = np.zeros(len(data), dtype=np.bool_)
+    if wildcard_positions:
+        wildcard_mask[list(wildcard_positions)] = True
+
+    if _find_best_atom_nb is not None:
+        best_index, best_score = _find_best_atom_nb(arr, wildcard_mask)
+        if best_index < 0:
+            return None, 0
+        return data[best_index : best_index + 4].hex().upper(), int(best_score)
+
+    windows = np.lib.stride_tricks.sliding_window_view(arr, 4)
+
+    # Windows overlapping a wildcard are invalid; a prefix sum over the mask
+    # makes each window test a single subtraction
+    cum = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum(wildcard_mask, out=cum[1:])
+    valid = (cum[4:] - cum[:-4]) == 0
+    if not valid.any():
+        return None, 0
+
+    w0, w1, w2, w3 = windows[:, 0], windows[:, 1], windows[:, 2], windows[:, 3]
 
-    for i in range(len(data) - 3):
-        # Skip if any byte in this window is a wildcard
-        if any(p in range(i, i + 4) for p in wildcard_positions):
-            continue
+    scores = np.full(len(windows), 100, dtype=np.int64)
+
+    # Penalize repeated bytes (unique count = 4 - duplicates of earlier bytes)
+    duplicates = (
+        (w1 == w0).astype(np.int64)
+        + ((w2 == w0) | (w2 == w1)).astype(np.int64)
+        + ((w3 == w0) | (w3 == w1) | (w3 == w2)).astype(np.int64)
+    )
+    unique_counts = 4 - duplicates
+    scores -= np.where(unique_counts == 1, 80, 0)
+    scores -= np.where(unique_counts == 2, 40, 0)
+
+    # Penalize null bytes
+    scores -= (windows == 0).sum(axis=1) * 15
+
+    # Penalize known common patterns and sequences via packed uint32 membership
+    packed = (
+        w0.astype(np.uint32)
+        | (w1.astype(np.uint32) << 8)
+        | (w2.astype(np.uint32) << 16)
+        | (w3.astype(np.uint32) << 24)
+    )
+    scores -= np.where(np.isin(packed, _REPEATED_U32), 60, 0)
+    scores -= np.where(np.isin(packed, _COMMON_U32), 30, 0)
+
+    # Penalize printable ASCII-only (less unique)
+    scores -= np.where(((windows >= 0x20) & (windows <= 0x7E)).all(axis=1), 10, 0)
 
-        atom = data[i : i + 4]
-        score = score_atom(atom)
+    np.clip(scores, 0, 100, out=scores)
+    scores[~valid] = -1
 
-        if score > best_score:
-            best_score = score
-            best_atom = atom.hex().upper()
+    best_index = int(scores.argmax())
+    best_score = int(scores[best_index])
+    if best_score <= 0:
+        return None, 0
 
-    return best_atom, best_score
+    return data[best_index : best_index + 4].hex().upper(), best_score
 
 
 def score_atom(atom: bytes) -> int:
-    """Score a 4-byte atom for quality (0-100)."""
+    """Score a 4-byte atom for quality (0-100) in a single pass."""
     if len(atom) != 4:
         return 0
 
+    b0, b1, b2, b3 = atom
     score = 100
 
-    # Penalize repeated bytes
-    if len(set(atom)) == 1:
+    # Penalize repeated bytes (unique count = 4 - duplicates of earlier bytes)
+    duplicates = (b1 == b0) + (b2 in (b0, b1)) + (b3 in (b0, b1, b2))
+    if duplicates == 3:
         score -= 80  # All same byte
-    elif len(set(atom)) == 2:
+    elif duplicates == 2:
         score -= 40  # Only 2 unique bytes
 
     # Penalize null bytes
-    null_count = atom.count(0x00)
-    score -= null_count * 15
-
-    # Penalize known common patterns
-    for pattern, _ in REPEATED_PATTERNS:
-        if pattern in atom:
-            score -= 60
-            break
+    score -= ((b0 == 0) + (b1 == 0) + (b2 == 0) + (b3 == 0)) * 15
 
-    # Penalize common sequences
-    for seq in COMMON_SEQUENCES:
-        if seq in atom:
-            score -= 30
-            break
+    # Penalize known common patterns and sequences (hashed uint32 membership)
+    packed = b0 | b1 << 8 | b2 << 16 | b3 << 24
+    if packed in _REPEATED_SET:
+        score -= 60
+    if packed in _COMMON_SET:
+        score -= 30
 
     # Penalize printable ASCII-only (less unique)
-    if all(0x20 <= b <= 0x7E for b in atom):
+    if 0x20 <= b0 <= 0x7E and 0x20 <= b1 <= 0x7E and 0x20 <= b2 <= 0x7E and 0x20 <= b3 <= 0x7E:
         score -= 10
 
     return max(0, score)
 
 
-def analyze_text_string(string_id: str, value: str, modifiers: list[str]) -> StringAnalysis:
-    """Analyze a text string for atom quality."""
-    issues = []
+# Issue template: (severity, message, suggestion) without the string_id,
+# so identical string values across rules/files share one cached analysis
+_IssueTemplate = tuple[str, str, "str | None"]
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_text_core(
+    value: bytes, modifiers: tuple[str, ...]
+) -> tuple[tuple[_IssueTemplate, ...], str | None, int]:
+    """string_id-independent core of analyze_text_string, cached per value."""
+    issues: list[_IssueTemplate] = []
 
     byte_count = len(value)
 
     # Check minimum length
     if byte_count < 4:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message=f"String is only {byte_count} bytes; no valid 4-byte atom possible",
-                suggestion="Use a longer string (4+ bytes minimum)",
+            (
+                "error",
+                f"String is only {byte_count} bytes; no valid 4-byte atom possible",
+                "Use a longer string (4+ bytes minimum)",
             )
         )
-        return StringAnalysis(
-            string_id=string_id,
-            string_type="text",
-            raw_value=value,
-            byte_count=byte_count,
-            issues=issues,
-        )
+        return tuple(issues), None, byte_count
 
     # YARA-X specific: base64 modifier requires 3+ chars
     if "base64" in modifiers and byte_count < 3:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message=f"String uses 'base64' but is only {byte_count} chars; "
+            (
+                "error",
+                f"String uses 'base64' but is only {byte_count} chars; "
                 "YARA-X requires 3+ characters for base64 modifier",
-                suggestion="Use a string of 3+ characters with base64 modifier",
+                "Use a string of 3+ characters with base64 modifier",
             )
         )
 
-    # Convert to bytes for analysis
-    try:
-        data = value.encode("utf-8")
-    except UnicodeEncodeError:
-        data = value.encode("latin-1")
-
-    best_atom, score = find_best_atom(data, [])
+    best_atom, score = find_best_atom(value, ())
 
     # Check score
     if score < 30:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message=f"Best atom score is {score}/100; string will cause slow scanning",
-                suggestion="Choose a more unique string or add distinguishing bytes",
+            (
+                "error",
+                f"Best atom score is {score}/100; string will cause slow scanning",
+                "Choose a more unique string or add distinguishing bytes",
             )
         )
     elif score < 60:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="warning",
-                message=f"Best atom score is {score}/100; may cause performance issues",
+            (
+                "warning",
+                f"Best atom score is {score}/100; may cause performance issues",
+                None,
             )
         )
 
     # Check modifiers
     if "nocase" in modifiers and byte_count > 15:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="info",
-                message="'nocase' on long string doubles atom generation",
-                suggestion="Consider if case-insensitivity is truly needed",
+            (
+                "info",
+                "'nocase' on long string doubles atom generation",
+                "Consider if case-insensitivity is truly needed",
             )
         )
 
     if "wide" in modifiers and "ascii" in modifiers:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="info",
-                message="'wide ascii' doubles matching; ensure both encodings are needed",
+            (
+                "info",
+                "'wide ascii' doubles matching; ensure both encodings are needed",
+                None,
             )
         )
 
+    return tuple(issues), best_atom, byte_count
+
+
+def analyze_text_string(string_id: str, value: bytes, modifiers: list[str]) -> StringAnalysis:
+    """Analyze a text string for atom quality."""
+    templates, best_atom, byte_count = _analyze_text_core(value, tuple(modifiers))
+
     return StringAnalysis(
         string_id=string_id,
         string_type="text",
-        raw_value=value,
+        raw_value=_decode(value),
         byte_count=byte_count,
-        issues=issues,
+        issues=[
+            AtomIssue(
+                string_id=string_id,
+                severity=severity,
+                message=message,
+                suggestion=suggestion,
+            )
+            for severity, message, suggestion in templates
+        ],
         best_atom=best_atom,
     )
 
 
-def analyze_hex_string(string_id: str, value: str) -> StringAnalysis:
-    """Analyze a hex string for atom quality."""
-    issues = []
+@functools.lru_cache(maxsize=4096)
+def _analyze_hex_core(value: str) -> tuple[tuple[_IssueTemplate, ...], str | None, int]:
+    """string_id-independent core of analyze_hex_string, cached per value."""
+    issues: list[_IssueTemplate] = []
 
     data, wildcard_positions = hex_string_to_bytes(value)
     byte_count = len(data)
@@ -273,29 +429,21 @@ def analyze_hex_string(string_id: str, value: str) -> StringAnalysis:
     # Check minimum length
     if byte_count < 4:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message=f"Hex string is only {byte_count} bytes; no valid 4-byte atom possible",
-                suggestion="Use a longer hex pattern (4+ bytes minimum)",
+            (
+                "error",
+                f"Hex string is only {byte_count} bytes; no valid 4-byte atom possible",
+                "Use a longer hex pattern (4+ bytes minimum)",
             )
         )
-        return StringAnalysis(
-            string_id=string_id,
-            string_type="byte",
-            raw_value=value,
-            byte_count=byte_count,
-            issues=issues,
-        )
+        return tuple(issues), None, byte_count
 
     # Check for leading wildcards
     if 0 in wildcard_positions and 1 in wildcard_positions:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="warning",
-                message="Hex string starts with wildcards; atoms will be extracted from middle/end",
-                suggestion="Move fixed bytes to the beginning if possible",
+            (
+                "warning",
+                "Hex string starts with wildcards; atoms will be extracted from middle/end",
+                "Move fixed bytes to the beginning if possible",
             )
         )
 
@@ -304,156 +452,177 @@ def analyze_hex_string(string_id: str, value: str) -> StringAnalysis:
         wildcard_ratio = len(wildcard_positions) / byte_count
         if wildcard_ratio > 0.5:
             issues.append(
-                AtomIssue(
-                    string_id=string_id,
-                    severity="warning",
-                    message=f"High wildcard density ({wildcard_ratio:.0%}); may limit atom options",
+                (
+                    "warning",
+                    f"High wildcard density ({wildcard_ratio:.0%}); may limit atom options",
+                    None,
                 )
             )
 
-    best_atom, score = find_best_atom(data, wildcard_positions)
+    best_atom, score = find_best_atom(data, tuple(wildcard_positions))
 
     if best_atom is None:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message="No valid 4-byte atom found (too many wildcards)",
-                suggestion="Reduce wildcards or add fixed byte sequences",
+            (
+                "error",
+                "No valid 4-byte atom found (too many wildcards)",
+                "Reduce wildcards or add fixed byte sequences",
             )
         )
     elif score < 30:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="error",
-                message=f"Best atom score is {score}/100; string will cause slow scanning",
+            (
+                "error",
+                f"Best atom score is {score}/100; string will cause slow scanning",
+                None,
             )
         )
     elif score < 60:
         issues.append(
-            AtomIssue(
-                string_id=string_id,
-                severity="warning",
-                message=f"Best atom score is {score}/100; may cause performance issues",
+            (
+                "warning",
+                f"Best atom score is {score}/100; may cause performance issues",
+                None,
             )
         )
 
+    return tuple(issues), best_atom, byte_count
+
+
+def analyze_hex_string(string_id: str, value: str) -> StringAnalysis:
+    """Analyze a hex string for atom quality."""
+    templates, best_atom, byte_count = _analyze_hex_core(value)
+
     return StringAnalysis(
         string_id=string_id,
         string_type="byte",
         raw_value=value,
         byte_count=byte_count,
-        issues=issues,
+        issues=[
+            AtomIssue(
+                string_id=string_id,
+                severity=severity,
+                message=message,
+                suggestion=suggestion,
+            )
+            for severity, message, suggestion in templates
+        ],
         best_atom=best_atom,
     )
 
 
-def extract_strings(content: str, rule_name: str) -> list[dict]:
-    """Extract strings from a rule using regex."""
-    strings = []
-
-    # Find the rule block
-    rule_pattern = rf"rule\s+{re.escape(rule_name)}\s*\{{"
-    rule_match = re.search(rule_pattern, content)
-    if not rule_match:
-        return strings
-
-    # Find strings section
-    start = rule_match.end()
-    brace_count = 1
-    pos = start
-    while pos < len(content) and brace_count > 0:
-        if content[pos] == "{":
-            brace_count += 1
-        elif content[pos] == "}":
-            brace_count -= 1
-        pos += 1
-
-    rule_content = content[start : pos - 1]
-
-    strings_match = re.search(r"strings\s*:\s*(.*?)(?=condition\s*:|$)", rule_content, re.DOTALL)
-    if not strings_match:
-        return strings
-
-    strings_section = strings_match.group(1)
-
-    # Parse text strings: $name = "value" modifiers
-    for match in re.finditer(r'(\$\w+)\s*=\s*"([^"]*)"([^\n]*)', strings_section):
-        modifiers = match.group(3).strip().split()
-        strings.append(
-            {
-                "name": match.group(1),
-                "value": match.group(2),
-                "type": "text",
-                "modifiers": modifiers,
-            }
-        )
+# One-shot scanner: rule headers and the three string forms as alternatives,
+# so a single finditer pass tokenizes the whole file. Bytes patterns so the
+# raw file contents are scanned without an up-front decode
+_RULE_SCAN = re.compile(
+    rb"(?P<rule>\brule\s+(?P<rule_name>\w+)\s*(?::[^{]*)?\{)"
+    rb'|(?P<text>(?P<text_name>\$\w+)\s*=\s*"(?P<text_value>[^"]*)"(?P<text_mods>[^\n]*))'
+    rb"|(?P<hex>(?P<hex_name>\$\w+)\s*=\s*\{(?P<hex_value>[^}]*)\})"
+    rb"|(?P<regex>(?P<regex_name>\$\w+)\s*=\s*/(?P<regex_value>[^/]*)/(?P<regex_mods>[^\n]*))"
+)
 
-    # Parse hex strings: $name = { hex }
-    for match in re.finditer(r"(\$\w+)\s*=\s*\{([^}]*)\}", strings_section):
-        strings.append(
-            {
-                "name": match.group(1),
-                "value": match.group(2).strip(),
-                "type": "byte",
-                "modifiers": [],
-            }
-        )
 
-    # Parse regex strings: $name = /pattern/ modifiers
-    for match in re.finditer(r"(\$\w+)\s*=\s*/([^/]*)/([^\n]*)", strings_section):
-        modifiers = match.group(3).strip().split()
-        strings.append(
-            {
-                "name": match.group(1),
-                "value": match.group(2),
-                "type": "regex",
-                "modifiers": modifiers,
-            }
-        )
+def _decode(raw: bytes) -> str:
+    """Decode an extracted slice for display/analysis."""
+    return raw.decode("utf-8", errors="replace")
+
+
+@functools.lru_cache(maxsize=16)
+def _scan_rule_strings(content: bytes) -> dict[str, list[dict]]:
+    """Tokenize all rules' string definitions in one pass over the source.
 
-    return strings
+    Scans the raw bytes and decodes only the extracted slices. Cached so
+    analyzing each rule of a multi-rule file parses the content only once
+    instead of O(rules x file size).
 
+    Returns:
+        Mapping of rule name to its string entries, in source order.
+    """
+    rules: dict[str, list[dict]] = {}
+    current: list[dict] | None = None
 
-def extract_rule_names(content: str) -> list[str]:
+    for match in _RULE_SCAN.finditer(content):
+        if match.group("rule") is not None:
+            current = rules.setdefault(_decode(match.group("rule_name")), [])
+        elif current is None:
+            continue
+        elif match.group("text") is not None:
+            current.append(
+                {
+                    "name": _decode(match.group("text_name")),
+                    # Raw bytes; text analysis scores bytes directly
+                    "value": match.group("text_value"),
+                    "type": "text",
+                    "modifiers": _decode(match.group("text_mods")).strip().split(),
+                }
+            )
+        elif match.group("hex") is not None:
+            current.append(
+                {
+                    "name": _decode(match.group("hex_name")),
+                    "value": _decode(match.group("hex_value")).strip(),
+                    "type": "byte",
+                    "modifiers": [],
+                }
+            )
+        elif match.group("regex") is not None:
+            current.append(
+                {
+                    "name": _decode(match.group("regex_name")),
+                    "value": _decode(match.group("regex_value")),
+                    "type": "regex",
+                    "modifiers": _decode(match.group("regex_mods")).strip().split(),
+                }
+            )
+
+    return rules
+
+
+def extract_strings(content: bytes, rule_name: str) -> list[dict]:
+    """Extract strings from a rule using the one-shot scanner."""
+    return _scan_rule_strings(content).get(rule_name, [])
+
+
+def extract_rule_names(content: bytes) -> list[str]:
     """Extract rule names from YARA source."""
-    return re.findall(r"(?:private\s+)?rule\s+(\w+)\s*[:{]", content)
+    return [_decode(name) for name in _RULE_NAMES.findall(content)]
 
 
-def analyze_rule(rule_name: str, content: str) -> Iterator[StringAnalysis]:
+def analyze_rule(rule_name: str, content: bytes) -> Iterator[StringAnalysis]:
     """Analyze all strings in a rule."""
     strings = extract_strings(content, rule_name)
 
     for string in strings:
         string_id = string.get("name", "$unknown")
-        string_value = string.get("value", "")
         string_type = string.get("type", "text")
         modifiers = string.get("modifiers", [])
 
         if string_type == "text":
-            yield analyze_text_string(string_id, string_value, modifiers)
+            yield analyze_text_string(string_id, string.get("value", b""), modifiers)
         elif string_type == "byte":
-            yield analyze_hex_string(string_id, string_value)
+            yield analyze_hex_string(string_id, string.get("value", ""))
         # Regex strings are harder to analyze for atoms; skip for now
 
 
-def analyze_file(file_path: Path, *, verbose: bool = False) -> int:
+def analyze_file(file_path: Path, *, verbose: bool = False, validate: bool = True) -> int:
     """Analyze a YARA file and print results."""
     try:
-        content = file_path.read_text()
+        content = file_path.read_bytes()
     except OSError as e:
         print(f"Error reading {file_path}: {e}", file=sys.stderr)
         return 1
 
-    # Validate with yara-x first
-    try:
-        compiler = yara_x.Compiler()
-        compiler.add_source(content)
-        compiler.build()
-    except yara_x.CompileError as e:
-        print(f"\033[91mYARA-X compilation error in {file_path}:\033[0m {e}", file=sys.stderr)
-        # Continue with analysis anyway for educational purposes
+    # Validate with yara-x first; the compile pass dominates wall time on
+    # large rulesets, so it can be skipped for atom-only analysis. yara-x
+    # wants str source, so the full decode happens only on this path
+    if validate:
+        try:
+            compiler = yara_x.Compiler()
+            compiler.add_source(content.decode("utf-8"))
+            compiler.build()
+        except (UnicodeDecodeError, yara_x.CompileError) as e:
+            print(f"\033[91mYARA-X compilation error in {file_path}:\033[0m {e}", file=sys.stderr)
+            # Continue with analysis anyway for educational purposes
 
     rule_names = extract_rule_names(content)
     has_issues = False
@@ -494,28 +663,55 @@ def analyze_file(file_path: Path, *, verbose: bool = False) -> int:
     return 1
 
 
+def _analyze_file_captured(
+    file_path: Path, *, verbose: bool = False, validate: bool = True
+) -> tuple[str, int]:
+    """Run analyze_file with stdout captured, for use by worker processes."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        status = analyze_file(file_path, verbose=verbose, validate=validate)
+    return buffer.getvalue(), status
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="YARA-X string atom quality analyzer")
     parser.add_argument("path", type=Path, help="YARA file to analyze")
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show all strings, not just issues"
     )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip yara-x compilation and only run atom analysis",
+    )
     args = parser.parse_args()
+    validate = not args.no_validate
 
     if not args.path.exists():
         print(f"Error: {args.path} does not exist", file=sys.stderr)
         return 1
 
     if args.path.is_file():
-        return analyze_file(args.path, verbose=args.verbose)
+        return analyze_file(args.path, verbose=args.verbose, validate=validate)
     elif args.path.is_dir():
+        files = [p for p in args.path.rglob("*") if p.suffix in {".yar", ".yara"}]
         exit_code = 0
-        for yar_file in args.path.rglob("*.yar"):
-            if analyze_file(yar_file, verbose=args.verbose) != 0:
-                exit_code = 1
-        for yar_file in args.path.rglob("*.yara"):
-            if analyze_file(yar_file, verbose=args.verbose) != 0:
-                exit_code = 1
+
+        # Per-file analysis is independent and CPU-bound; fan out across
+        # cores for larger rulesets, keeping output in file order
+        if len(files) < 4:
+            for yar_file in files:
+                if analyze_file(yar_file, verbose=args.verbose, validate=validate) != 0:
+                    exit_code = 1
+            return exit_code
+
+        worker = functools.partial(_analyze_file_captured, verbose=args.verbose, validate=validate)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for output, status in pool.map(worker, files):
+                if output:
+                    print(output, end="")
+                if status != 0:
+                    exit_code = 1
         return exit_code
     else:
         print(f"Error: {args.path} is not a file or directory", file=sys.stderr)
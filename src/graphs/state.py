@@ -1,7 +1,12 @@
-from typing_extensions import TypedDict
+from dataclasses import dataclass
+from typing import Any
 
+# Sentinel distinguishing a missing key from an explicit None
+_MISSING = object()
 
-class GraphState(TypedDict):
+
+@dataclass(slots=True)
+class GraphState:
     """
     The primary state object passed between nodes in the graph.
     Fields:
@@ -10,6 +15,16 @@ class GraphState(TypedDict):
         decision: The random value (0 or 1). Range [0, 1].
     """
 
-    input: str
-    message: str
-    decision: int | None
+    input: str = ""
+    message: str = ""
+    decision: int | None = None
+
+
+def validate_graph_state(state: Any) -> None:
+    """Validate a state mapping against the GraphState requirements from spec."""
+    val = state.get("input", _MISSING)
+    if val is None or val is _MISSING:
+        raise ValueError("input MUST not be null")
+    # Bitwise | evaluates both bounds without a short-circuit jump
+    if (val := state.get("decision")) is not None and (val < 0) | (val > 1):
+        raise ValueError("decision must be in range [0, 1]")
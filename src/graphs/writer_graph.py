@@ -1,5 +1,5 @@
 import logging
-import random
+from random import getrandbits as _getrandbits
 
 from langgraph.graph import END, START, StateGraph
 
@@ -12,8 +12,8 @@ def process_input(state: GraphState) -> dict:
     """
     Initial processing node. Logs the input for traceability.
     """
-    input_text = state.get("input", "")
-    logger.info(f"Processing input: {input_text}")
+    input_text = state.input
+    logger.info("Processing input: %s", input_text)
     return {}
 
 
@@ -21,8 +21,8 @@ def route_logic(state: GraphState) -> str:
     """
     Conditional edge logic that branches based on a random dynamic value.
     """
-    decision = random.randint(0, 1)
-    logger.info(f"Random decision: {decision}")
+    decision = _getrandbits(1)
+    logger.info("Random decision: %d", decision)
 
     if decision == 0:
         return "world"
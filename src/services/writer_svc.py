@@ -1,5 +1,6 @@
 from typing import cast
 
+from graphs.state import GraphState
 from graphs.writer_graph import create_graph
 
 
@@ -8,8 +9,19 @@ class WriterSvc:
     Service layer that acts as the interface between the entry point and the graph engine.
     """
 
+    _graph = None
+
+    @classmethod
+    def _get_graph(cls):
+        """
+        Lazily compiles the WriterGraph once and shares it across instances.
+        """
+        if cls._graph is None:
+            cls._graph = create_graph()
+        return cls._graph
+
     def __init__(self):
-        self.graph = create_graph()
+        self.graph = self._get_graph()
 
     def run(self, input_text: str) -> str:
         """
@@ -19,7 +31,7 @@ class WriterSvc:
         if not input_text:
             input_text = "No input provided"
 
-        initial_state = {"input": input_text, "message": "", "decision": None}
+        initial_state = GraphState(input=input_text)
 
         result = self.graph.invoke(initial_state)
         return cast("str", result["message"])
@@ -0,0 +1,42 @@
+import pytest
+
+from graphs.state import GraphState
+
+
+@pytest.fixture(scope="session")
+def graph():
+    """Compiled WriterGraph shared across the whole test session.
+
+    Imported lazily so collection (and --collect-only) never pays the
+    LangGraph import cost.
+    """
+    from graphs.writer_graph import create_graph
+
+    return create_graph()
+
+
+@pytest.fixture(scope="session")
+def writer_svc():
+    """WriterSvc instance shared across the whole test session."""
+    from services.writer_svc import WriterSvc
+
+    return WriterSvc()
+
+
+@pytest.fixture(scope="session")
+def prompt_text():
+    """Input prompt fetched once per session; the stub may grow real I/O."""
+    from app.stubs import user_prompt
+
+    return user_prompt()
+
+
+@pytest.fixture
+def runner(request, graph, writer_svc):
+    """Callable running text through either the graph or the service layer.
+
+    Parametrize indirectly with "graph" or "svc" to pick the entry point.
+    """
+    if request.param == "graph":
+        return lambda text: graph.invoke(GraphState(input=text))["message"]
+    return writer_svc.run
@@ -1,5 +1,7 @@
 from services.writer_svc import WriterSvc
 
+_VALID_MESSAGES = frozenset({"Hello World", "Hello Universe"})
+
 
 def test_ts_010_writer_svc_interface() -> None:
     """TS-010: WriterSvc run interface"""
@@ -7,4 +9,4 @@ def test_ts_010_writer_svc_interface() -> None:
     input_text = "Test Input"
     result = svc.run(input_text)
     assert isinstance(result, str)
-    assert result in ["Hello World", "Hello Universe"]
+    assert result in _VALID_MESSAGES
@@ -1,49 +1,54 @@
-from app.stubs import user_prompt
-from graphs.writer_graph import create_graph
+import logging
+from unittest.mock import MagicMock
 
+import pytest
 
-def test_ts_001_graph_execution_output() -> None:
-    """TS-001: Entry point execution (Hello World/Universe)"""
-    graph = create_graph()
-    input_text = user_prompt()
-    # Run the graph
-    result = graph.invoke({"input": input_text, "message": "", "decision": None})
-    assert result["message"] in ["Hello World", "Hello Universe"]
+import app.main
+from graphs.state import GraphState
 
+_VALID_MESSAGES = frozenset({"Hello World", "Hello Universe"})
 
-def test_ts_002_graph_input_traceability(caplog) -> None:
-    """TS-002: Traceability of input string"""
-    import logging
 
-    # Set up logging capture
-    logging.getLogger().setLevel(logging.INFO)
-    graph = create_graph()
-    input_text = "Specific Traceable Input"
-    graph.invoke({"input": input_text, "message": "", "decision": None})
-    # Check if input_text appears in logs
-    assert input_text in caplog.text
+@pytest.mark.slow
+@pytest.mark.parametrize("runner", ["graph", "svc"], indirect=True)
+def test_ts_001_ts_004_execution_output(runner, prompt_text) -> None:
+    """TS-001/TS-004: Entry point and service layer execution (Hello World/Universe)"""
+    assert runner(prompt_text) in _VALID_MESSAGES
 
 
-def test_ts_003_main_calls_stub(monkeypatch) -> None:
-    """TS-003: Entry point call to input stub"""
-    import app.main
+def test_graph_batch_execution(graph, prompt_text) -> None:
+    """Batched invocation amortizes dispatch overhead across inputs"""
+    inputs = ["", "test", "Specific Traceable Input", prompt_text]
+    results = graph.batch([GraphState(input=text) for text in inputs])
+    assert len(results) == len(inputs)
+    assert all(result["message"] in _VALID_MESSAGES for result in results)
 
-    called = False
 
-    def mock_prompt():
-        nonlocal called
-        called = True
-        return "mock"
+@pytest.fixture
+def info_logs(caplog):
+    """Capture INFO records from the graph logger only, scoped to one test."""
+    caplog.set_level(logging.INFO, logger="graphs")
+    return caplog
 
-    monkeypatch.setattr(app.main, "user_prompt", mock_prompt)
-    app.main.main()
-    assert called
 
+def test_ts_002_graph_input_traceability(graph, info_logs) -> None:
+    """TS-002: Traceability of input string"""
+    input_text = "Specific Traceable Input"
+    graph.invoke(GraphState(input=input_text))
+    # Check if input_text appears in a log record (without formatting them all)
+    assert any(input_text in record.getMessage() for record in info_logs.records)
 
-def test_ts_004_svc_executes_graph() -> None:
-    """TS-004: Service layer execution of graph engine"""
-    from services.writer_svc import WriterSvc
 
-    svc = WriterSvc()
-    result = svc.run("test")
-    assert result in ["Hello World", "Hello Universe"]
+@pytest.fixture
+def mock_prompt(monkeypatch):
+    """Replace the entry point's input stub with a MagicMock."""
+    mock = MagicMock(return_value="mock")
+    monkeypatch.setattr(app.main, "user_prompt", mock)
+    return mock
+
+
+def test_ts_003_main_calls_stub(mock_prompt) -> None:
+    """TS-003: Entry point call to input stub"""
+    app.main.main()
+    mock_prompt.assert_called_once()
+
@@ -1,9 +1,11 @@
 from services.writer_svc import WriterSvc
 
+_VALID_MESSAGES = frozenset({"Hello World", "Hello Universe"})
+
 
 def test_ts_009_empty_input_handling() -> None:
     """TS-009: Handle empty input"""
     svc = WriterSvc()
     # Run with empty string
     result = svc.run("")
-    assert result in ["Hello World", "Hello Universe"]
+    assert result in _VALID_MESSAGES